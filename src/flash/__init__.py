@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Root package info."""
+import importlib
 import os
+from typing import TYPE_CHECKING, Any, List
 
 import numpy
 
@@ -22,15 +24,17 @@ for tp_name, tp_ins in [("object", object), ("bool", bool), ("float", float)]:
         setattr(numpy, tp_name, tp_ins)
 
 from flash.__about__ import *  # noqa: F401 E402 F403
-from flash.core.data.callback import FlashCallback  # noqa: E402
-from flash.core.data.data_module import DataModule  # noqa: E402
-from flash.core.data.io.input import DataKeys, Input  # noqa: E402
-from flash.core.data.io.input_transform import InputTransform  # noqa: E402
-from flash.core.data.io.output import Output  # noqa: E402
-from flash.core.data.io.output_transform import OutputTransform  # noqa: E402
-from flash.core.model import Task  # noqa: E402
-from flash.core.trainer import Trainer  # noqa: E402
-from flash.core.utilities.stages import RunningStage  # noqa: E402
+
+if TYPE_CHECKING:
+    from flash.core.data.callback import FlashCallback
+    from flash.core.data.data_module import DataModule
+    from flash.core.data.io.input import DataKeys, Input
+    from flash.core.data.io.input_transform import InputTransform
+    from flash.core.data.io.output import Output
+    from flash.core.data.io.output_transform import OutputTransform
+    from flash.core.model import Task
+    from flash.core.trainer import Trainer
+    from flash.core.utilities.stages import RunningStage
 
 _PACKAGE_ROOT = os.path.dirname(__file__)
 ASSETS_ROOT = os.path.join(_PACKAGE_ROOT, "assets")
@@ -42,6 +46,34 @@ if _IS_TESTING:
 
     seed_everything(42)
 
+# The public API is resolved lazily (PEP 562) so that ``import flash`` doesn't pull in PyTorch Lightning and
+# torchmetrics until one of these names is actually used.
+_LAZY_IMPORTS = {
+    "DataKeys": "flash.core.data.io.input",
+    "DataModule": "flash.core.data.data_module",
+    "FlashCallback": "flash.core.data.callback",
+    "Input": "flash.core.data.io.input",
+    "InputTransform": "flash.core.data.io.input_transform",
+    "Output": "flash.core.data.io.output",
+    "OutputTransform": "flash.core.data.io.output_transform",
+    "RunningStage": "flash.core.utilities.stages",
+    "Task": "flash.core.model",
+    "Trainer": "flash.core.trainer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     "DataKeys",
     "DataModule",
@@ -109,5 +109,6 @@ class SpeechRecognition(Task):
         transform: INPUT_TRANSFORM_TYPE = InputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        load_cache_size: int = 0,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output)
+        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output, load_cache_size)
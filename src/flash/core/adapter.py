@@ -140,6 +140,7 @@ class AdapterTask(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         return self.adapter.process_train_dataset(
             dataset,
@@ -152,6 +153,7 @@ class AdapterTask(Task):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_val_dataset(
@@ -166,6 +168,7 @@ class AdapterTask(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         return self.adapter.process_val_dataset(
             dataset,
@@ -178,6 +181,7 @@ class AdapterTask(Task):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_test_dataset(
@@ -192,6 +196,7 @@ class AdapterTask(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         return self.adapter.process_test_dataset(
             dataset,
@@ -204,6 +209,7 @@ class AdapterTask(Task):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_predict_dataset(
@@ -218,6 +224,7 @@ class AdapterTask(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         return self.adapter.process_predict_dataset(
             dataset,
@@ -230,4 +237,5 @@ class AdapterTask(Task):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
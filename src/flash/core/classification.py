@@ -194,12 +194,16 @@ class ClassesOutput(PredsClassificationOutput):
     def transform(self, sample: Any) -> Union[int, List[int]]:
         sample = super().transform(sample)
         if self.multi_label:
-            one_hot = (sample.sigmoid() > self.threshold).int().tolist()
-            result = []
-            for index, value in enumerate(one_hot):
-                if value == 1:
-                    result.append(index)
-            return result
+            return (sample.sigmoid() > self.threshold).nonzero(as_tuple=True)[-1].tolist()
+        if sample.is_quantized:
+            # With a single (positive) scale, the integer values have the same ordering as the dequantized logits
+            if sample.qscheme() in (torch.per_tensor_affine, torch.per_tensor_symmetric):
+                sample = sample.int_repr()
+            else:
+                sample = sample.dequantize()
+        if sample.device.type == "cpu" and sample.dtype != torch.bfloat16:
+            # NumPy avoids the dispatcher overhead of ``torch.argmax`` on the (small) CPU tensors we get here
+            return sample.detach().numpy().argmax(-1).tolist()
         return torch.argmax(sample, -1).tolist()
 
 
@@ -282,15 +286,13 @@ class FiftyOneLabelsOutput(ClassificationOutput):
             logits = pred.tolist()
 
         if self.multi_label:
-            one_hot = (pred.sigmoid() > self.threshold).int().tolist()
-            classes = []
-            for index, value in enumerate(one_hot):
-                if value == 1:
-                    classes.append(index)
-            probabilities = torch.sigmoid(pred).tolist()
+            probabilities = torch.sigmoid(pred)
+            classes = (probabilities > self.threshold).nonzero(as_tuple=True)[-1].tolist()
+            probabilities = probabilities.tolist()
         else:
-            classes = torch.argmax(pred, -1).tolist()
-            probabilities = torch.softmax(pred, -1).tolist()
+            # softmax is monotonic, so one max over the probabilities gives both the confidence and the class
+            confidence, classes = torch.softmax(pred, -1).max(-1)
+            confidence, classes = confidence.item(), classes.item()
 
         if self._labels is not None:
             if self.multi_label:
@@ -306,7 +308,6 @@ class FiftyOneLabelsOutput(ClassificationOutput):
                     logits=logits,
                 )
             else:
-                confidence = max(probabilities)
                 if self.threshold is not None and confidence < self.threshold:
                     fo_predictions = None
                 else:
@@ -331,7 +332,6 @@ class FiftyOneLabelsOutput(ClassificationOutput):
                     logits=logits,
                 )
             else:
-                confidence = max(probabilities)
                 if self.threshold is not None and confidence < self.threshold:
                     fo_predictions = None
                 else:
@@ -11,8 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TYPE_CHECKING, Any, Callable, List
+import copy
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
+import torch
+from pytorch_lightning.utilities.apply_func import apply_to_collection
 from torch import Tensor, nn
 
 from flash.core.data.utilities.classification import _is_list_like
@@ -26,20 +30,74 @@ class _ServeInputProcessor(nn.Module):
         self,
         serve_input: "ServeInput",
         collate_fn: Callable,
+        device: Optional[Union[str, torch.device]] = None,
+        load_cache_size: int = 0,
     ):
         super().__init__()
         self.serve_input = serve_input
         self.collate_fn = collate_fn
+        self.device = torch.device(device) if device is not None else None
+        self._copy_stream = None
+        if self.device is not None and self.device.type == "cuda":
+            self._copy_stream = torch.cuda.Stream(self.device)
+        self._load_sample = serve_input._call_load_sample
+        self._cached_load_sample = None
+        if load_cache_size > 0:
+            self._cached_load_sample = functools.lru_cache(maxsize=load_cache_size)(self._load_sample)
+
+    def _load(self, sample: Any) -> Any:
+        if self._cached_load_sample is not None:
+            try:
+                # Containers such as tuples can hold unhashable members, these are loaded without the cache
+                hash(sample)
+            except TypeError:
+                pass
+            else:
+                # Deep copy the cached sample so that in-place transforms don't leak into later requests
+                return copy.deepcopy(self._cached_load_sample(sample))
+        return self._load_sample(sample)
 
     def forward(self, sample: str):
-        sample = self.serve_input._call_load_sample(sample)
+        sample = self._load(sample)
         if not isinstance(sample, list):
             sample = [sample]
-        return self.collate_fn(sample)
+        batch = self.collate_fn(sample)
+        if self.device is not None:
+            return _to_device_async(batch, self.device, stream=self._copy_stream)
+        return batch
 
 
 def _is_list_like_excluding_str(x):
-    return _is_list_like(x) and str(x) != x
+    return not isinstance(x, str) and _is_list_like(x)
+
+
+def _uncollate_dict(batch: dict) -> List[dict]:
+    lengths = set()
+    for sub_batch in batch.values():
+        if not _is_list_like_excluding_str(sub_batch):
+            raise ValueError("When uncollating a dict, all sub-batches (values) are expected to be list-like.")
+        lengths.add(len(sub_batch))
+    if len(lengths) > 1:
+        raise ValueError("When uncollating a dict, all sub-batches (values) are expected to have the same length.")
+    keys = tuple(batch)
+    columns = [torch.unbind(value, 0) if isinstance(value, Tensor) else value for value in batch.values()]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def _uncollate_tensor(batch: Tensor) -> List[Tensor]:
+    return list(torch.unbind(batch, 0))
+
+
+def _uncollate_sequence(batch: Union[list, tuple]) -> List[Any]:
+    return list(batch)
+
+
+_UNCOLLATE_FNS: Dict[type, Callable[[Any], List[Any]]] = {
+    Tensor: _uncollate_tensor,
+    dict: _uncollate_dict,
+    list: _uncollate_sequence,
+    tuple: _uncollate_sequence,
+}
 
 
 def default_uncollate(batch: Any) -> List[Any]:
@@ -60,16 +118,44 @@ def default_uncollate(batch: Any) -> List[Any]:
         ValueError: If the input is not a ``dict`` or list-like.
 
     """
+    uncollate_fn = _UNCOLLATE_FNS.get(type(batch))
+    if uncollate_fn is not None:
+        return uncollate_fn(batch)
+    # Subclasses (e.g. ``nn.Parameter``, ``OrderedDict``, named tuples) miss the exact type lookup
+    if isinstance(batch, Tensor):
+        return _uncollate_tensor(batch)
     if isinstance(batch, dict):
-        if any(not _is_list_like_excluding_str(sub_batch) for sub_batch in batch.values()):
-            raise ValueError("When uncollating a dict, all sub-batches (values) are expected to be list-like.")
-        if len({len(sub_batch) for sub_batch in batch.values()}) > 1:
-            raise ValueError("When uncollating a dict, all sub-batches (values) are expected to have the same length.")
-        elements = [default_uncollate(element) for element in zip(*batch.values())]
-        return [dict(zip(batch.keys(), element)) for element in elements]
-    if isinstance(batch, (list, tuple, Tensor)):
-        return list(batch)
+        return _uncollate_dict(batch)
+    if isinstance(batch, (list, tuple)):
+        return _uncollate_sequence(batch)
     raise ValueError(
         "The batch of outputs to be uncollated is expected to be a `dict` or list-like "
         f"(e.g. `Tensor`, `list`, `tuple`, etc.), but got input of type: {type(batch)}"
     )
+
+
+def _to_device_async(batch: Any, device: torch.device, stream: Optional["torch.cuda.Stream"] = None) -> Any:
+    """Copies all the tensors in a (nested) batch to the given device with ``non_blocking=True``.
+
+    CPU tensors are pinned first when copying to a CUDA device so that the copies are actually asynchronous. If a CUDA
+    ``stream`` is given, all the copies are issued on it and the current stream is made to wait for them.
+
+    """
+    pin = device.type == "cuda"
+    current_stream = torch.cuda.current_stream(device) if stream is not None else None
+
+    def _copy(tensor: Tensor) -> Tensor:
+        if pin and tensor.device.type == "cpu" and not tensor.is_pinned():
+            tensor = tensor.pin_memory()
+        tensor = tensor.to(device, non_blocking=True)
+        if current_stream is not None:
+            # the memory is allocated on ``stream`` but will be used on ``current_stream``
+            tensor.record_stream(current_stream)
+        return tensor
+
+    if stream is None:
+        return apply_to_collection(batch, Tensor, _copy)
+    with torch.cuda.stream(stream):
+        batch = apply_to_collection(batch, Tensor, _copy)
+    current_stream.wait_stream(stream)
+    return batch
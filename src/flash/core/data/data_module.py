@@ -14,9 +14,9 @@
 import os
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
-import numpy as np
 import pytorch_lightning as pl
 import torch
+from pytorch_lightning.utilities import rank_zero_info
 from torch.utils.data import DataLoader, Dataset
 from torch.utils.data.dataset import IterableDataset
 from torch.utils.data.sampler import Sampler
@@ -32,7 +32,7 @@ from flash.core.data.io.input_transform import (
     create_worker_input_transform_processor,
 )
 from flash.core.data.splits import SplitDataset
-from flash.core.data.utils import _STAGES_PREFIX
+from flash.core.data.utils import _STAGES_PREFIX, _prefetch_kwargs
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
 from flash.core.utilities.stages import RunningStage
 from flash.core.utilities.types import INPUT_TRANSFORM_TYPE
@@ -42,6 +42,20 @@ if not _TOPIC_CORE_AVAILABLE:
     __doctest_skip__ = ["DataModule"]
 
 
+def _auto_num_workers() -> int:
+    """Returns a number of ``DataLoader`` workers suited to the CPUs available to this process and the number of
+    GPUs sharing them."""
+    try:
+        # Respects CPU affinity / cgroup limits, but isn't available on all platforms
+        num_cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        num_cpus = os.cpu_count() or 1
+    if torch.cuda.is_available():
+        # Beyond ~8 workers per device the inter-process communication tends to dominate
+        return min(num_cpus // max(1, torch.cuda.device_count()), 8)
+    return min(num_cpus, 2)
+
+
 class DatasetInput(Input):
     """The ``DatasetInput`` implements default behaviours for data sources which expect the input to
     :meth:`~flash.core.data.io.input.Input.load_data` to be a :class:`torch.utils.data.dataset.Dataset`"""
@@ -69,9 +83,19 @@ class DataModule(pl.LightningDataModule):
         val_split: An optional float which gives the relative amount of the training dataset to use for the validation
             dataset.
         batch_size: The batch size to be used by the DataLoader.
-        num_workers: The number of workers to use for parallelized loading.
+        num_workers: The number of workers to use for parallelized loading. If ``None``, the number of workers is
+            chosen based on the available CPUs and GPUs.
         sampler: A sampler following the :class:`~torch.utils.data.sampler.Sampler` type.
             Will be passed to the DataLoader for the training dataset. Defaults to None.
+        pin_memory: If ``True``, the DataLoaders will copy batches into pinned memory so they can be transferred to
+            the GPU asynchronously. Ignored when CUDA is not available and when predicting on fewer than
+            ``8 * batch_size`` samples. Pinned memory is page-locked, so set this to ``False`` if host memory is
+            scarce (e.g. with many workers or a large ``prefetch_factor``).
+        persistent_workers: If ``True``, the DataLoaders will keep their worker processes alive between epochs.
+            Only used when ``num_workers > 0`` and not used when predicting.
+        prefetch_factor: The number of batches loaded in advance by each worker. Only used when ``num_workers > 0``.
+            If ``None``, the PyTorch default is used. Up to ``num_workers * prefetch_factor`` batches are kept in
+            (pinned) host memory at any time.
 
     Examples
     ________
@@ -118,10 +142,11 @@ class DataModule(pl.LightningDataModule):
         transform_kwargs: Optional[Dict] = None,
         val_split: Optional[float] = None,
         batch_size: Optional[int] = None,
-        num_workers: int = 0,
+        num_workers: Optional[int] = 0,
         sampler: Optional[Union[Callable, Sampler, Type[Sampler]]] = None,
         pin_memory: bool = True,
         persistent_workers: bool = False,
+        prefetch_factor: Optional[int] = None,
     ) -> None:
         if not batch_size:
             raise TypeError("The `batch_size` should be provided to the DataModule on instantiation.")
@@ -164,9 +189,14 @@ class DataModule(pl.LightningDataModule):
 
         self.batch_size = batch_size
 
+        if num_workers is None:
+            num_workers = _auto_num_workers()
+            rank_zero_info(f"Using {num_workers} workers for the DataLoaders.")
         self.num_workers = num_workers
         self.persistent_workers = persistent_workers and num_workers > 0
-        self.pin_memory = pin_memory
+        self.prefetch_factor = prefetch_factor
+        # Pinning only speeds up host to CUDA copies, without CUDA it just wastes page-locked memory
+        self.pin_memory = pin_memory and torch.cuda.is_available()
 
         self.sampler = sampler
 
@@ -208,6 +238,9 @@ class DataModule(pl.LightningDataModule):
             input_transform.callbacks = [self.data_fetcher]
         return input_transform
 
+    def _prefetch_kwargs(self) -> Dict[str, int]:
+        return _prefetch_kwargs(self.num_workers, self.prefetch_factor)
+
     def _train_dataloader(self) -> DataLoader:
         train_ds: Input = self._train_input
 
@@ -238,6 +271,7 @@ class DataModule(pl.LightningDataModule):
                 persistent_workers=self.persistent_workers,
                 input_transform=input_transform,
                 trainer=self.trainer,
+                **self._prefetch_kwargs(),
             )
         else:
             dataloader = DataLoader(
@@ -250,6 +284,7 @@ class DataModule(pl.LightningDataModule):
                 drop_last=drop_last,
                 collate_fn=create_worker_input_transform_processor(RunningStage.TRAINING, input_transform),
                 persistent_workers=self.persistent_workers,
+                **self._prefetch_kwargs(),
             )
 
         self._on_after_batch_transfer_fns = None
@@ -271,6 +306,7 @@ class DataModule(pl.LightningDataModule):
                 persistent_workers=self.persistent_workers,
                 input_transform=input_transform,
                 trainer=self.trainer,
+                **self._prefetch_kwargs(),
             )
         else:
             dataloader = DataLoader(
@@ -280,6 +316,7 @@ class DataModule(pl.LightningDataModule):
                 pin_memory=self.pin_memory,
                 collate_fn=create_worker_input_transform_processor(RunningStage.VALIDATING, input_transform),
                 persistent_workers=self.persistent_workers,
+                **self._prefetch_kwargs(),
             )
 
         self._on_after_batch_transfer_fns = None
@@ -301,6 +338,7 @@ class DataModule(pl.LightningDataModule):
                 persistent_workers=self.persistent_workers,
                 input_transform=input_transform,
                 trainer=self.trainer,
+                **self._prefetch_kwargs(),
             )
         else:
             dataloader = DataLoader(
@@ -310,6 +348,7 @@ class DataModule(pl.LightningDataModule):
                 pin_memory=self.pin_memory,
                 collate_fn=create_worker_input_transform_processor(RunningStage.TESTING, input_transform),
                 persistent_workers=self.persistent_workers,
+                **self._prefetch_kwargs(),
             )
 
         self._on_after_batch_transfer_fns = None
@@ -320,10 +359,15 @@ class DataModule(pl.LightningDataModule):
 
         input_transform = self._resolve_input_transform()
 
+        # Predictions are a single pass over the data: there are no epochs to keep the workers alive for, and
+        # allocating pinned host buffers costs more than it saves when there are only a few batches to load
+        pin_memory = self.pin_memory
         if isinstance(predict_ds, IterableDataset):
             batch_size = self.batch_size
         else:
-            batch_size = min(self.batch_size, len(predict_ds) if len(predict_ds) > 0 else 1)
+            num_samples = len(predict_ds)
+            batch_size = min(self.batch_size, num_samples or 1)
+            pin_memory = pin_memory and num_samples >= 8 * self.batch_size
 
         if isinstance(getattr(self, "trainer", None), pl.Trainer) and hasattr(
             self.trainer.lightning_module, "process_predict_dataset"
@@ -332,19 +376,21 @@ class DataModule(pl.LightningDataModule):
                 predict_ds,
                 self.batch_size,
                 num_workers=self.num_workers,
-                pin_memory=self.pin_memory,
-                persistent_workers=self.persistent_workers,
+                pin_memory=pin_memory,
+                persistent_workers=False,
                 input_transform=input_transform,
                 trainer=self.trainer,
+                **self._prefetch_kwargs(),
             )
         else:
             dataloader = DataLoader(
                 predict_ds,
                 batch_size=batch_size,
                 num_workers=self.num_workers,
-                pin_memory=self.pin_memory,
+                pin_memory=pin_memory,
                 collate_fn=create_worker_input_transform_processor(RunningStage.PREDICTING, input_transform),
-                persistent_workers=self.persistent_workers,
+                persistent_workers=False,
+                **self._prefetch_kwargs(),
             )
 
         self._on_after_batch_transfer_fns = None
@@ -357,6 +403,12 @@ class DataModule(pl.LightningDataModule):
     def _load_on_after_batch_transfer_fns(self) -> None:
         self._on_after_batch_transfer_fns = {}
 
+        input_transform = self._resolve_input_transform()
+        if input_transform is None:
+            return
+
+        # Every stage gets a processor, even when it has no on-device transforms, so that the data fetcher still
+        # receives its ``on_per_batch_transform_on_device`` callbacks
         for stage in [
             RunningStage.TRAINING,
             RunningStage.VALIDATING,
@@ -364,16 +416,10 @@ class DataModule(pl.LightningDataModule):
             RunningStage.TESTING,
             RunningStage.PREDICTING,
         ]:
-            input_transform = self._resolve_input_transform()
-
-            if input_transform is not None:
-                transform = create_device_input_transform_processor(
-                    stage if stage != RunningStage.SANITY_CHECKING else RunningStage.VALIDATING,
-                    input_transform,
-                )
-                self._on_after_batch_transfer_fns[stage] = transform
-            else:
-                self._on_after_batch_transfer_fns[stage] = None
+            self._on_after_batch_transfer_fns[stage] = create_device_input_transform_processor(
+                stage if stage != RunningStage.SANITY_CHECKING else RunningStage.VALIDATING,
+                input_transform,
+            )
 
     def on_after_batch_transfer(self, batch: Any, dataloader_idx: int) -> Any:
         if getattr(self, "trainer", None) is None:
@@ -382,9 +428,11 @@ class DataModule(pl.LightningDataModule):
         if self._on_after_batch_transfer_fns is None:
             self._load_on_after_batch_transfer_fns()
 
-        stage = self.trainer.state.stage
+        # nothing to apply on device, skip the trainer state lookup
+        if not self._on_after_batch_transfer_fns:
+            return batch
 
-        transform = self._on_after_batch_transfer_fns[stage]
+        transform = self._on_after_batch_transfer_fns.get(self.trainer.state.stage)
 
         if transform:
             batch = transform(batch)
@@ -439,12 +487,16 @@ class DataModule(pl.LightningDataModule):
 
     def _reset_iterator(self, stage: str) -> Iterable[Any]:
         iter_name = f"_{stage}_iter"
-        # num_workers has to be set to 0 to work properly
-        num_workers = self.num_workers
-        self.num_workers = 0
-        dataloader_fn = getattr(self, f"{stage}_dataloader")
-        iterator = iter(dataloader_fn())
-        self.num_workers = num_workers
+        # num_workers has to be set to 0 to work properly (torch then also rejects persistent workers). The regular
+        # builder is used so that the sampler and any ``process_*_dataset`` hook of the attached ``Task`` apply as they
+        # would during training.
+        num_workers, persistent_workers = self.num_workers, self.persistent_workers
+        self.num_workers, self.persistent_workers = 0, False
+        try:
+            dataloader = getattr(self, f"{stage}_dataloader")()
+        finally:
+            self.num_workers, self.persistent_workers = num_workers, persistent_workers
+        iterator = iter(dataloader)
         setattr(self, iter_name, iterator)
         return iterator
 
@@ -531,11 +583,10 @@ class DataModule(pl.LightningDataModule):
         self._show_batch(stage_name, hooks_names, limit_nb_samples, figsize, reset=reset)
 
     def _get_property(self, property_name: str) -> Optional[Any]:
-        train = getattr(self.train_dataset, property_name, None)
-        val = getattr(self.val_dataset, property_name, None)
-        test = getattr(self.test_dataset, property_name, None)
-        filtered = list(filter(lambda x: x is not None, [train, val, test]))
-        return filtered[0] if len(filtered) > 0 else None
+        # ``is not None`` rather than truthiness so that e.g. an explicit ``multi_label=False`` is kept
+        inputs = (self.train_dataset, self.val_dataset, self.test_dataset)
+        values = (getattr(dataset, property_name, None) for dataset in inputs)
+        return next((value for value in values if value is not None), None)
 
     @property
     def num_classes(self) -> Optional[int]:
@@ -576,9 +627,10 @@ class DataModule(pl.LightningDataModule):
         if isinstance(train_dataset, IterableInput):
             raise ValueError("`val_split` should be `None` when the dataset is built with an IterableDataset.")
 
-        val_num_samples = int(len(train_dataset) * val_split)
-        indices = list(range(len(train_dataset)))
-        np.random.shuffle(indices)
+        num_samples = len(train_dataset)
+        val_num_samples = int(num_samples * val_split)
+        # drawn from torch's global generator so that the split follows ``seed_everything`` / ``torch.manual_seed``
+        indices = torch.randperm(num_samples, dtype=torch.int32 if num_samples < 2**31 else torch.int64).numpy()
         val_indices = indices[:val_num_samples]
         train_indices = indices[val_num_samples:]
         return (
@@ -25,6 +25,9 @@ from flash.core.utilities.stages import RunningStage
 
 GenericMeta = type
 
+# Hook names per stage, resolved once rather than formatted for every sample
+_LOAD_SAMPLE_HOOKS = {stage: f"{prefix}_load_sample" for stage, prefix in _STAGES_PREFIX.items()}
+
 
 if not os.environ.get("READTHEDOCS", False):
     from torch.utils.data import IterableDataset
@@ -175,17 +178,11 @@ class InputBase(Properties, metaclass=_InputMeta):
 
     def _call_load_sample(self, sample: Any) -> Any:
         # Deepcopy the sample to avoid leaks with complex data structures
-        sample_output = getattr(self, f"{_STAGES_PREFIX[self.running_stage]}_load_sample")(_deepcopy_dict(sample))
+        sample_output = getattr(self, _LOAD_SAMPLE_HOOKS[self.running_stage])(_deepcopy_dict(sample))
 
         # Change DataKeys Enum to strings
         if isinstance(sample_output, dict):
-            output_dict = {}
-            for key, val in sample_output.items():
-                if isinstance(key, Enum) and hasattr(key, "value"):
-                    output_dict[key.value] = val
-                else:
-                    output_dict[key] = val
-            return output_dict
+            return {key.value if isinstance(key, Enum) else key: val for key, val in sample_output.items()}
         return sample_output
 
     @staticmethod
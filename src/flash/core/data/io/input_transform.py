@@ -36,6 +36,11 @@ class InputTransformPlacement(LightningEnum):
 
 INVALID_STAGES_FOR_INPUT_TRANSFORMS = [RunningStage.SANITY_CHECKING, RunningStage.TUNING]
 
+_TRANSFORM_HOOKS = {
+    stage: tuple((placement.value, f"{prefix}_{placement.value}") for placement in InputTransformPlacement)
+    for stage, prefix in _STAGES_PREFIX.items()
+}
+
 
 @dataclass
 class _InputTransformPerStage:
@@ -621,6 +626,8 @@ class InputTransform:
 
     def _per_sample_transform(self, sample: Any, stage: RunningStage) -> Any:
         fn = self.current_transform(stage=stage, current_fn="per_sample_transform")
+        if fn is self._identity:
+            return sample
         if isinstance(sample, list):
             return [fn(s) for s in sample]
         return fn(sample)
@@ -648,6 +655,8 @@ class InputTransform:
 
         """
         fn = self.current_transform(stage=stage, current_fn="per_sample_transform_on_device")
+        if fn is self._identity:
+            return sample
         if isinstance(sample, list):
             return [fn(s) for s in sample]
         return fn(sample)
@@ -684,14 +693,9 @@ class InputTransform:
 
     def __resolve_transforms(self, running_stage: RunningStage) -> Optional[Dict[str, Callable]]:
         transforms = {}
-        stage = _STAGES_PREFIX[running_stage]
 
         # iterate over all transforms hook name
-        for transform_name in InputTransformPlacement:
-            transform_name = transform_name.value
-
-            method_name = f"{stage}_{transform_name}"
-
+        for transform_name, method_name in _TRANSFORM_HOOKS[running_stage]:
             # get associated transform
             try:
                 fn = getattr(self, method_name)()
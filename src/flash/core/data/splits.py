@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 import numpy as np
 from torch.utils.data import Dataset
@@ -13,7 +13,7 @@ class SplitDataset(Properties, Dataset):
     Args:
 
         dataset: A dataset to be split
-        indices: List of indices to expose from the dataset
+        indices: List (or numpy array) of indices to expose from the dataset
         use_duplicated_indices: Whether to allow duplicated indices.
 
     Example::
@@ -27,7 +27,7 @@ class SplitDataset(Properties, Dataset):
     def __init__(
         self,
         dataset: Any,
-        indices: List[int],
+        indices: Union[List[int], np.ndarray],
         running_stage: Optional[RunningStage] = None,
         use_duplicated_indices: bool = False,
     ) -> None:
@@ -38,16 +38,19 @@ class SplitDataset(Properties, Dataset):
             kwargs = {"running_stage": dataset._running_stage}
         super().__init__(**kwargs)
 
-        if not isinstance(indices, list):
-            raise TypeError("indices should be a list")
+        if not isinstance(indices, (list, np.ndarray)):
+            raise TypeError("indices should be a list or a numpy array")
 
-        indices = list(indices) if use_duplicated_indices else list(np.unique(indices))
+        if not use_duplicated_indices:
+            indices = np.unique(indices)
 
         if np.max(indices) >= len(dataset) or np.min(indices) < 0:
             raise ValueError(f"`indices` should be within [0, {len(dataset) -1}].")
 
         self.dataset = dataset
-        self.indices = indices
+        # A typed array takes a fraction of the memory of a list of Python ints
+        dtype = np.int32 if len(dataset) < 2**31 else np.int64
+        self.indices = np.array(indices, dtype=dtype)
 
     def __getattr__(self, key: str):
         if key != "dataset":
@@ -55,7 +58,7 @@ class SplitDataset(Properties, Dataset):
         raise AttributeError
 
     def __getitem__(self, index: int) -> Any:
-        return self.dataset[self.indices[index]]
+        return self.dataset[int(self.indices[index])]
 
     def __len__(self) -> int:
         return len(self.indices)
@@ -17,7 +17,7 @@ import numpy as np
 from torch import nn
 
 from flash.core.data.io.input import DataKeys
-from flash.core.data.utils import convert_to_modules
+from flash.core.data.utils import FuncModule, convert_to_modules
 from flash.core.utilities.imports import _ALBUMENTATIONS_AVAILABLE, requires
 
 if _ALBUMENTATIONS_AVAILABLE:
@@ -75,18 +75,23 @@ class ApplyToKeys(nn.Sequential):
             keys = [keys]
         self.keys = keys
 
+    def _apply_fns(self, inputs: Any) -> Any:
+        # Call the children directly, unwrapping ``FuncModule`` to skip its ``nn.Module.__call__`` dispatch
+        for module in self._modules.values():
+            inputs = module.func(inputs) if type(module) is FuncModule else module(inputs)
+        return inputs
+
     def forward(self, x: Mapping[str, Any]) -> Mapping[str, Any]:
-        keys = list(filter(lambda key: key in x, self.keys))
+        keys = [key for key in self.keys if key in x]
         inputs = [x[key] for key in keys]
 
-        result = {}
-        result.update(x)
+        result = dict(x)
 
         if len(inputs) == 1:
-            result[keys[0]] = super().forward(inputs[0])
+            result[keys[0]] = self._apply_fns(inputs[0])
         elif len(inputs) > 1:
             try:
-                outputs = super().forward(inputs)
+                outputs = self._apply_fns(inputs)
             except TypeError as e:
                 raise Exception("Failed to apply transforms to multiple keys at the same time.") from e
 
@@ -13,7 +13,8 @@
 # limitations under the License.
 from dataclasses import dataclass
 from functools import reduce
-from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union, cast
+from itertools import chain
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple, Type, Union, cast
 
 import numpy as np
 import torch
@@ -28,6 +29,11 @@ if not _TOPIC_CORE_AVAILABLE:
 
 
 def _is_list_like(x: Any) -> bool:
+    # Fast paths for the common target types, avoiding the exception raised for scalars below
+    if isinstance(x, (str, list, tuple)):
+        return len(x) > 0
+    if isinstance(x, (int, float)):
+        return False
     try:
         _ = x[0]
         _ = len(x)
@@ -178,10 +184,10 @@ class SingleBinaryTargetFormatter(TargetFormatter):
     binary: ClassVar[Optional[bool]] = True
 
     def format(self, target: Any) -> Any:
-        for idx, t in enumerate(target):
-            if t == 1:
-                return idx
-        return 0
+        try:
+            return _as_list(target).index(1)
+        except ValueError:
+            return 0
 
 
 @dataclass
@@ -209,7 +215,8 @@ class MultiNumericTargetFormatter(TargetFormatter):
 
     def format(self, target: Any) -> Any:
         result = [0] * self.num_classes
-        for idx in target:
+        # Convert tensors / arrays up front, indexing with 0-dim tensors element by element is slow
+        for idx in _as_list(target):
             result[idx] = 1
         return result
 
@@ -243,6 +250,13 @@ class MultiLabelTargetFormatter(SingleLabelTargetFormatter):
             result[idx] = 1
         return result
 
+    def _format_labels(self, labels: Iterable[str]) -> List[int]:
+        # The labels are known to be strings, so look them up directly rather than through ``super().format``
+        result = [0] * self.num_classes
+        for label in labels:
+            result[self.label_to_idx[_strip(label)]] = 1
+        return result
+
 
 @dataclass
 class CommaDelimitedMultiLabelTargetFormatter(MultiLabelTargetFormatter):
@@ -267,7 +281,7 @@ class CommaDelimitedMultiLabelTargetFormatter(MultiLabelTargetFormatter):
     binary: ClassVar[Optional[bool]] = False
 
     def format(self, target: Any) -> Any:
-        return super().format(target.split(","))
+        return self._format_labels(target.split(","))
 
 
 @dataclass
@@ -293,7 +307,7 @@ class SpaceDelimitedTargetFormatter(MultiLabelTargetFormatter):
     binary: ClassVar[Optional[bool]] = False
 
     def format(self, target: Any) -> Any:
-        return super().format(target.split(" "))
+        return self._format_labels(target.split(" "))
 
 
 @dataclass
@@ -378,10 +392,15 @@ def _get_target_formatter_type(target: Any) -> Type[TargetFormatter]:
             return MultiLabelTargetFormatter
         target = _as_list(target)
         if len(target) > 1:
-            if all(t == 0 or t == 1 for t in target):
-                if sum(target) == 1:
-                    return SingleBinaryTargetFormatter
-                return MultiBinaryTargetFormatter
+            # Check for binary values and count the ones in a single pass
+            num_ones = 0
+            for t in target:
+                if t == 1:
+                    num_ones += 1
+                elif t != 0:
+                    break
+            else:
+                return SingleBinaryTargetFormatter if num_ones == 1 else MultiBinaryTargetFormatter
             if any(isinstance(t, float) for t in target):
                 return MultiSoftTargetFormatter
             return MultiNumericTargetFormatter
@@ -440,12 +459,7 @@ def _get_target_details(
     targets = _as_list(targets)
     if target_formatter_type.numeric:
         # Take a max over all values
-        if target_formatter_type is MultiNumericTargetFormatter:
-            values = []
-            for target in targets:
-                values.extend(target)
-        else:
-            values = targets
+        values = chain.from_iterable(targets) if target_formatter_type is MultiNumericTargetFormatter else targets
         num_classes = _as_list(max(values))
         if _is_list_like(num_classes):
             num_classes = num_classes[0]
@@ -458,21 +472,16 @@ def _get_target_details(
         labels = None
     else:
         # Compute tokens
-        tokens = []
         if target_formatter_type is CommaDelimitedMultiLabelTargetFormatter:
-            for target in targets:
-                tokens.extend(target.split(","))
+            tokens = chain.from_iterable(target.split(",") for target in targets)
         elif target_formatter_type is SpaceDelimitedTargetFormatter:
-            for target in targets:
-                tokens.extend(target.split(" "))
+            tokens = chain.from_iterable(target.split(" ") for target in targets)
         elif target_formatter_type is MultiLabelTargetFormatter:
-            for target in targets:
-                tokens.extend(target)
+            tokens = chain.from_iterable(targets)
         else:
             tokens = targets
 
-        tokens = [_strip(token) for token in tokens]
-        labels = list(sorted_alphanumeric(set(tokens)))
+        labels = list(sorted_alphanumeric({_strip(token) for token in tokens}))
         num_classes = None
     return labels, num_classes
 
@@ -498,7 +507,7 @@ def get_target_formatter(
     """
     targets = _as_list(targets)
     target_formatter_type: Type[TargetFormatter] = reduce(
-        _resolve_target_formatter, [_get_target_formatter_type(target) for target in targets]
+        _resolve_target_formatter, (_get_target_formatter_type(target) for target in targets)
     )
     if labels is None and num_classes is None:
         labels, num_classes = _get_target_details(targets, target_formatter_type)
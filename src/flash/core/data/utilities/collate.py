@@ -14,7 +14,7 @@
 import functools
 from typing import Any, Callable, List, Mapping
 
-from torch.utils.data._utils.collate import default_collate as torch_default_collate
+from torch.utils.data.dataloader import default_collate as torch_default_collate
 
 from flash.core.data.io.input import DataKeys
 
@@ -53,7 +53,7 @@ _default_collate = wrap_collate(torch_default_collate)
 
 
 def default_collate(batch: List[Any]) -> Any:
-    """The :func:`flash.data.utilities.collate.default_collate` extends `torch.utils.data._utils.default_collate` to
+    """The :func:`flash.data.utilities.collate.default_collate` extends `torch.utils.data.dataloader.default_collate` to
     first extract any metadata from the samples in the batch (in the ``"metadata"`` key). The list of metadata entries
     will then be inserted into the collated result.
 
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from functools import partial
 from typing import Any, Callable, List, Optional, Union
 
 import pandas as pd
@@ -20,10 +19,6 @@ import pandas as pd
 from flash.core.data.utilities.paths import PATH_TYPE
 
 
-def _resolve_multi_target(target_keys: List[str], row: pd.Series) -> List[Any]:
-    return [row[target_key] for target_key in target_keys]
-
-
 def resolve_targets(data_frame: pd.DataFrame, target_keys: Union[str, List[str]]) -> List[Any]:
     """Given a data frame and a target key or list of target keys, this function returns a list of targets.
 
@@ -34,13 +29,8 @@ def resolve_targets(data_frame: pd.DataFrame, target_keys: Union[str, List[str]]
     """
     if not isinstance(target_keys, List):
         return data_frame[target_keys].tolist()
-    return data_frame.apply(partial(_resolve_multi_target, target_keys), axis=1).tolist()
-
-
-def _resolve_file(
-    resolver: Callable[[PATH_TYPE, Any], PATH_TYPE], root: PATH_TYPE, input_key: str, row: pd.Series
-) -> PATH_TYPE:
-    return resolver(root, row[input_key])
+    # Read only the target columns at once rather than building a ``pd.Series`` for every row
+    return data_frame[target_keys].values.tolist()
 
 
 def default_resolver(root: Optional[PATH_TYPE], file_id: Any) -> PATH_TYPE:
@@ -68,4 +58,4 @@ def resolve_files(
     """
     if resolver is None:
         resolver = default_resolver
-    return data_frame.apply(partial(_resolve_file, resolver, root, key), axis=1).tolist()
+    return [resolver(root, file_id) for file_id in data_frame[key].tolist()]
@@ -68,7 +68,8 @@ def _load_image_from_image(file):
     img = Image.open(file)
     img.load()
 
-    return img.convert("RGB")
+    # ``convert`` copies the image even when the mode is unchanged
+    return img if img.mode == "RGB" else img.convert("RGB")
 
 
 def _load_image_from_numpy(file):
@@ -167,14 +167,17 @@ def filter_valid_files(
             f"The number of files ({len(files)}) and the number of items in any additional lists must be the same."
         )
 
-    filtered = list(
-        filter(lambda sample: has_file_allowed_extension(sample[0], valid_extensions), zip(files, *additional_lists))
-    )
+    # Partition in a single pass, the file lists can be very large
+    filtered = []
+    invalid = []
+    for sample in zip(files, *additional_lists):
+        if has_file_allowed_extension(sample[0], valid_extensions):
+            filtered.append(sample)
+        else:
+            invalid.append(sample[0])
 
     filtered_files = [f[0] for f in filtered]
 
-    invalid = [f for f in files if f not in filtered_files]
-
     if invalid:
         invalid_extensions = list({"." + f.split(".")[-1] for f in invalid})
         rank_zero_warn(
@@ -142,6 +142,14 @@ class FuncModule(nn.Module):
         return str(self.func)
 
 
+def _prefetch_kwargs(num_workers: int, prefetch_factor: Optional[int]) -> Dict[str, int]:
+    """Returns the ``prefetch_factor`` keyword argument for a ``DataLoader``, which torch rejects when loading in the
+    main process."""
+    if num_workers > 0 and prefetch_factor is not None:
+        return {"prefetch_factor": prefetch_factor}
+    return {}
+
+
 def convert_to_modules(transforms: Optional[Dict[str, Callable]]):
     if transforms is None or isinstance(transforms, nn.Module):
         return transforms
@@ -22,6 +22,7 @@ import flash
 from flash.core.adapter import Adapter
 from flash.core.data.io.input import DataKeys, InputBase
 from flash.core.data.io.input_transform import InputTransform, create_worker_input_transform_processor
+from flash.core.data.utils import _prefetch_kwargs
 from flash.core.integrations.icevision.transforms import (
     from_icevision_predictions,
     from_icevision_record,
@@ -132,6 +133,7 @@ class IceVisionAdapter(Adapter):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         data_loader = import_module(self.model_type).train_dl(
             dataset,
@@ -142,6 +144,7 @@ class IceVisionAdapter(Adapter):
             drop_last=drop_last,
             sampler=sampler,
             persistent_workers=persistent_workers,
+            **_prefetch_kwargs(num_workers, prefetch_factor),
         )
 
         data_loader = self._update_collate_fn_dataloader(
@@ -168,6 +171,7 @@ class IceVisionAdapter(Adapter):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         data_loader = import_module(self.model_type).valid_dl(
             dataset,
@@ -178,6 +182,7 @@ class IceVisionAdapter(Adapter):
             drop_last=drop_last,
             sampler=sampler,
             persistent_workers=persistent_workers,
+            **_prefetch_kwargs(num_workers, prefetch_factor),
         )
 
         data_loader = self._update_collate_fn_dataloader(
@@ -204,6 +209,7 @@ class IceVisionAdapter(Adapter):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         data_loader = import_module(self.model_type).valid_dl(
             dataset,
@@ -214,6 +220,7 @@ class IceVisionAdapter(Adapter):
             drop_last=drop_last,
             sampler=sampler,
             persistent_workers=persistent_workers,
+            **_prefetch_kwargs(num_workers, prefetch_factor),
         )
 
         data_loader = self._update_collate_fn_dataloader(
@@ -240,6 +247,7 @@ class IceVisionAdapter(Adapter):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         data_loader = import_module(self.model_type).infer_dl(
             dataset,
@@ -250,6 +258,7 @@ class IceVisionAdapter(Adapter):
             drop_last=drop_last,
             sampler=sampler,
             persistent_workers=persistent_workers,
+            **_prefetch_kwargs(num_workers, prefetch_factor),
         )
 
         data_loader = self._update_collate_fn_dataloader(
@@ -347,40 +347,23 @@ def _parse_labelstudio_arguments(
     val_split: Optional[float] = None,
     multi_label: Optional[bool] = False,
 ):
-    train_data = None
-    val_data = None
-    test_data = None
-    predict_data = None
     data = {
         "data_folder": data_folder,
         "export_json": export_json,
         "multi_label": multi_label,
     }
 
-    if (train_data_folder or data_folder) and train_export_json:
-        train_data = {
-            "data_folder": train_data_folder or data_folder,
-            "export_json": train_export_json,
-            "multi_label": multi_label,
-        }
-    if (val_data_folder or data_folder) and val_export_json:
-        val_data = {
-            "data_folder": val_data_folder or data_folder,
-            "export_json": val_export_json,
-            "multi_label": multi_label,
-        }
-    if (test_data_folder or data_folder) and test_export_json:
-        test_data = {
-            "data_folder": test_data_folder or data_folder,
-            "export_json": test_export_json,
-            "multi_label": multi_label,
-        }
-    if (predict_data_folder or data_folder) and predict_export_json:
-        predict_data = {
-            "data_folder": predict_data_folder or data_folder,
-            "export_json": predict_export_json,
-            "multi_label": multi_label,
-        }
+    train_data, val_data, test_data, predict_data = (
+        {"data_folder": stage_data_folder or data_folder, "export_json": stage_export_json, "multi_label": multi_label}
+        if (stage_data_folder or data_folder) and stage_export_json
+        else None
+        for stage_data_folder, stage_export_json in (
+            (train_data_folder, train_export_json),
+            (val_data_folder, val_export_json),
+            (test_data_folder, test_export_json),
+            (predict_data_folder, predict_export_json),
+        )
+    )
 
     train_data = train_data if train_data else data
 
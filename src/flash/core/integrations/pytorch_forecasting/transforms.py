@@ -13,7 +13,7 @@
 # limitations under the License.
 from typing import Any, Dict, List, Tuple
 
-from torch.utils.data._utils.collate import default_collate
+from torch.utils.data.dataloader import default_collate
 
 from flash.core.data.io.input import DataKeys
 
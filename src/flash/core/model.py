@@ -40,6 +40,7 @@ from flash.core.data.io.output import Output
 from flash.core.data.io.output_transform import OutputTransform
 from flash.core.data.output import BASE_OUTPUTS
 from flash.core.data.utilities.collate import default_collate
+from flash.core.data.utils import _prefetch_kwargs
 from flash.core.finetuning import _FINETUNING_STRATEGIES_REGISTRY
 from flash.core.hooks import FineTuningHooks
 from flash.core.optimizers.optimizers import _OPTIMIZERS_REGISTRY
@@ -133,6 +134,7 @@ class DatasetProcessor:
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         input_transform = input_transform or self.input_transform
 
@@ -153,6 +155,7 @@ class DatasetProcessor:
             sampler=sampler,
             collate_fn=collate_fn,
             persistent_workers=persistent_workers,
+            **_prefetch_kwargs(num_workers, prefetch_factor),
         )
 
     def process_val_dataset(
@@ -167,6 +170,7 @@ class DatasetProcessor:
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         input_transform = input_transform or self.input_transform
 
@@ -187,6 +191,7 @@ class DatasetProcessor:
             sampler=sampler,
             collate_fn=collate_fn,
             persistent_workers=persistent_workers,
+            **_prefetch_kwargs(num_workers, prefetch_factor),
         )
 
     def process_test_dataset(
@@ -201,6 +206,7 @@ class DatasetProcessor:
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         input_transform = input_transform or self.input_transform
 
@@ -221,6 +227,7 @@ class DatasetProcessor:
             sampler=sampler,
             collate_fn=collate_fn,
             persistent_workers=persistent_workers,
+            **_prefetch_kwargs(num_workers, prefetch_factor),
         )
 
     def process_predict_dataset(
@@ -235,6 +242,7 @@ class DatasetProcessor:
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         input_transform = input_transform or self.input_transform
 
@@ -255,6 +263,7 @@ class DatasetProcessor:
             sampler=sampler,
             collate_fn=collate_fn,
             persistent_workers=persistent_workers,
+            **_prefetch_kwargs(num_workers, prefetch_factor),
         )
 
 
@@ -854,6 +863,7 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
         transform: INPUT_TRANSFORM_TYPE = InputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        load_cache_size: int = 0,
     ) -> "Composition":
         """Serve the ``Task``. Override this method to provide a default ``input_cls``, ``transform``, and
         ``transform_kwargs``.
@@ -865,6 +875,9 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
             input_cls: The ``ServeInput`` type to use.
             transform: The transform to use when serving.
             transform_kwargs: Keyword arguments used to instantiate the transform.
+            output: The :class:`~flash.core.data.io.output.Output` to use to convert the predictions.
+            load_cache_size: If greater than zero, the number of loaded inputs to cache so that repeated requests for
+                the same input skip loading.
 
         """
         from flash.core.serve.flash_components import build_flash_serve_model_component
@@ -881,7 +894,9 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
         if sanity_check:
             self.run_serve_sanity_check(serve_input, transform, transform_kwargs, output)
 
-        comp = build_flash_serve_model_component(self, serve_input, output, transform, transform_kwargs)
+        comp = build_flash_serve_model_component(
+            self, serve_input, output, transform, transform_kwargs, load_cache_size=load_cache_size
+        )
         composition = Composition(predict=comp, TESTING=flash._IS_TESTING)
         composition.serve(host=host, port=port)
         return composition
@@ -53,7 +53,7 @@ class FlashOutputs(BaseType):
         return None
 
 
-def build_flash_serve_model_component(model, serve_input, output, transform, transform_kwargs):
+def build_flash_serve_model_component(model, serve_input, output, transform, transform_kwargs, load_cache_size=0):
     # TODO: Resolve this hack
     data_module = DataModule(
         predict_input=serve_input,
@@ -88,7 +88,17 @@ def build_flash_serve_model_component(model, serve_input, output, transform, tra
             self.device = self.model.device
 
         @expose(
-            inputs={"inputs": FlashInputs(_ServeInputProcessor(serve_input, collate_fn))},
+            inputs={
+                "inputs": FlashInputs(
+                    _ServeInputProcessor(
+                        serve_input,
+                        collate_fn,
+                        # CPU models would only get no-op copies
+                        device=model.device if model.device.type == "cuda" else None,
+                        load_cache_size=load_cache_size,
+                    )
+                )
+            },
             outputs={"outputs": FlashOutputs(output)},
         )
         def predict(self, inputs):
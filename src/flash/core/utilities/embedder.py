@@ -49,6 +49,7 @@ class Embedder(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         return self.model.process_predict_dataset(
             dataset,
@@ -61,6 +62,7 @@ class Embedder(Task):
             persistent_workers,
             input_transform,
             trainer,
+            prefetch_factor,
         )
 
     def _make_hook(self):
@@ -333,6 +333,7 @@ class Learn2LearnAdapter(Adapter):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         dataset = self._convert_dataset(
             trainer=trainer,
@@ -358,6 +359,7 @@ class Learn2LearnAdapter(Adapter):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_val_dataset(
@@ -372,6 +374,7 @@ class Learn2LearnAdapter(Adapter):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         dataset = self._convert_dataset(
             trainer=trainer,
@@ -397,6 +400,7 @@ class Learn2LearnAdapter(Adapter):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_test_dataset(
@@ -411,6 +415,7 @@ class Learn2LearnAdapter(Adapter):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         dataset = self._convert_dataset(
             trainer=trainer,
@@ -436,6 +441,7 @@ class Learn2LearnAdapter(Adapter):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_predict_dataset(
@@ -450,6 +456,7 @@ class Learn2LearnAdapter(Adapter):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         if not self._algorithm_has_validated:
             raise RuntimeError(
@@ -467,6 +474,7 @@ class Learn2LearnAdapter(Adapter):
             sampler=sampler,
             persistent_workers=persistent_workers,
             input_transform=input_transform,
+            prefetch_factor=prefetch_factor,
         )
 
 
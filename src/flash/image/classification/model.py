@@ -173,8 +173,9 @@ class ImageClassifier(ClassificationAdapterTask):
         transform: INPUT_TRANSFORM_TYPE = ImageClassificationInputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        load_cache_size: int = 0,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output)
+        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output, load_cache_size)
 
     def _ci_benchmark_fn(self, history: List[Dict[str, Any]]):
         """This function is used only for debugging usage with CI."""
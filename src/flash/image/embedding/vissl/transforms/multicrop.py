@@ -16,7 +16,7 @@ from functools import partial
 from typing import Any, Callable, Dict, Optional, Sequence
 
 import torch.nn as nn
-from torch.utils.data._utils.collate import default_collate
+from torch.utils.data.dataloader import default_collate
 
 from flash.core.data.io.input import DataKeys
 from flash.core.data.io.input_transform import InputTransform
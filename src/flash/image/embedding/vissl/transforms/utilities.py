@@ -26,7 +26,7 @@ def vissl_collate_helper(samples):
 
         result.append(_batch_ele_dict)
 
-    return torch.utils.data._utils.collate.default_collate(result)
+    return torch.utils.data.dataloader.default_collate(result)
 
 
 def multicrop_collate_fn(samples):
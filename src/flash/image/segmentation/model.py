@@ -205,8 +205,9 @@ class SemanticSegmentation(ClassificationTask):
         transform: INPUT_TRANSFORM_TYPE = SemanticSegmentationInputTransform,
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
+        load_cache_size: int = 0,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output)
+        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, output, load_cache_size)
 
     @staticmethod
     def _ci_benchmark_fn(history: List[Dict[str, Any]]):
@@ -150,6 +150,7 @@ class PointCloudObjectDetector(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         self._patch_dataset(dataset)
         return super().process_train_dataset(
@@ -163,6 +164,7 @@ class PointCloudObjectDetector(Task):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_val_dataset(
@@ -177,6 +179,7 @@ class PointCloudObjectDetector(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         self._patch_dataset(dataset)
         return super().process_val_dataset(
@@ -190,6 +193,7 @@ class PointCloudObjectDetector(Task):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_test_dataset(
@@ -204,6 +208,7 @@ class PointCloudObjectDetector(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         self._patch_dataset(dataset)
         return super().process_test_dataset(
@@ -217,6 +222,7 @@ class PointCloudObjectDetector(Task):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_predict_dataset(
@@ -231,6 +237,7 @@ class PointCloudObjectDetector(Task):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         self._patch_dataset(dataset)
         return super().process_predict_dataset(
@@ -244,4 +251,5 @@ class PointCloudObjectDetector(Task):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
@@ -168,6 +168,7 @@ class PointCloudSegmentation(ClassificationTask):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         self._patch_dataset(dataset)
         return super().process_train_dataset(
@@ -181,6 +182,7 @@ class PointCloudSegmentation(ClassificationTask):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_val_dataset(
@@ -195,6 +197,7 @@ class PointCloudSegmentation(ClassificationTask):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         self._patch_dataset(dataset)
         return super().process_val_dataset(
@@ -208,6 +211,7 @@ class PointCloudSegmentation(ClassificationTask):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_test_dataset(
@@ -222,6 +226,7 @@ class PointCloudSegmentation(ClassificationTask):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         self._patch_dataset(dataset)
         return super().process_test_dataset(
@@ -235,6 +240,7 @@ class PointCloudSegmentation(ClassificationTask):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def process_predict_dataset(
@@ -249,6 +255,7 @@ class PointCloudSegmentation(ClassificationTask):
         persistent_workers: bool = False,
         input_transform: Optional[InputTransform] = None,
         trainer: Optional["flash.Trainer"] = None,
+        prefetch_factor: Optional[int] = None,
     ) -> DataLoader:
         self._patch_dataset(dataset)
         return super().process_predict_dataset(
@@ -262,6 +269,7 @@ class PointCloudSegmentation(ClassificationTask):
             persistent_workers=persistent_workers,
             input_transform=input_transform,
             trainer=trainer,
+            prefetch_factor=prefetch_factor,
         )
 
     def modules_to_freeze(self) -> Union[nn.Module, Iterable[Union[nn.Module, Iterable]]]:
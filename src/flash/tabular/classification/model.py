@@ -159,8 +159,16 @@ class TabularClassifier(ClassificationAdapterTask):
         transform_kwargs: Optional[Dict] = None,
         output: Optional[Union[str, Output]] = None,
         parameters: Optional[Dict[str, Any]] = None,
+        load_cache_size: int = 0,
     ) -> Composition:
         parameters = parameters or self._data_parameters
         return super().serve(
-            host, port, sanity_check, partial(input_cls, parameters=parameters), transform, transform_kwargs, output
+            host,
+            port,
+            sanity_check,
+            partial(input_cls, parameters=parameters),
+            transform,
+            transform_kwargs,
+            output,
+            load_cache_size,
         )
@@ -11,12 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 import pytest
 import torch
-from flash.core.data.batch import default_uncollate
+from flash.core.data.batch import _ServeInputProcessor, _to_device_async, default_uncollate
+from flash.core.data.io.input import ServeInput
 from flash.core.utilities.imports import _TOPIC_CORE_AVAILABLE
+from torch.utils.data.dataloader import default_collate
 
 Case = namedtuple("Case", ["collated_batch", "uncollated_batch"])
 
@@ -38,6 +40,9 @@ cases = [
         [{"preds": 1, "metadata": 4}, {"preds": 2, "metadata": 5}, {"preds": 3, "metadata": 6}],
     ),
     Case(torch.tensor([1, 2, 3]), [torch.tensor(1), torch.tensor(2), torch.tensor(3)]),
+    # Subclasses
+    Case(OrderedDict(preds=[1, 2]), [{"preds": 1}, {"preds": 2}]),
+    Case(torch.nn.Parameter(torch.tensor([1.0, 2.0])), [torch.tensor(1.0), torch.tensor(2.0)]),
     # Mixed
     Case(
         {"preds": torch.tensor([1, 2, 3]), "metadata": [4, 5, 6]},
@@ -66,3 +71,50 @@ error_cases = [
 def test_default_uncollate_raises(error_case):
     with pytest.raises(ValueError, match=error_case.match):
         default_uncollate(error_case.collated_batch)
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="Test requires CUDA.")
+def test_serve_input_processor_device():
+    class CustomServeInput(ServeInput):
+        def serve_load_sample(self, sample):
+            return {"input": torch.tensor(sample)}
+
+    processor = _ServeInputProcessor(CustomServeInput(), default_collate, device="cuda")
+    batch = processor([1.0, 2.0])
+    assert batch["input"].device.type == "cuda"
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_serve_input_processor_load_cache():
+    loaded = []
+
+    class CustomServeInput(ServeInput):
+        def serve_load_sample(self, sample):
+            loaded.append(sample)
+            return {"input": torch.tensor(sample)}
+
+    processor = _ServeInputProcessor(CustomServeInput(), default_collate, load_cache_size=2)
+    for sample in (1.0, 1.0, 2.0):
+        batch = processor(sample)
+        assert torch.equal(batch["input"], torch.tensor([sample]))
+    assert loaded == [1.0, 2.0]
+
+    # Samples with unhashable members are loaded without the cache
+    batch = processor(([3.0],))
+    assert torch.equal(batch["input"], torch.tensor([[[3.0]]]))
+    assert loaded[-1] == ([3.0],)
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_to_device_async():
+    batch = {"input": torch.rand(2, 3), "metadata": [torch.rand(2)]}
+    moved = _to_device_async(batch, torch.device("cpu"))
+    assert torch.equal(moved["input"], batch["input"])
+    assert torch.equal(moved["metadata"][0], batch["metadata"][0])
+
+    if torch.cuda.is_available():
+        device = torch.device("cuda", 0)
+        moved = _to_device_async(batch, device, stream=torch.cuda.Stream(device))
+        assert moved["input"].device == device
+        assert torch.equal(moved["metadata"][0].cpu(), batch["metadata"][0])
@@ -19,6 +19,7 @@ import numpy as np
 import pytest
 import torch
 from flash import Task, Trainer
+from flash.core.data.base_viz import BaseVisualization
 from flash.core.data.data_module import DataModule, DatasetInput
 from flash.core.data.io.input import Input
 from flash.core.data.io.input_transform import InputTransform
@@ -466,3 +467,82 @@ def test_val_split():
 
     assert len(datamodule.train_dataset) == 80
     assert len(datamodule.val_dataset) == 20
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_auto_num_workers():
+    datamodule = DataModule(TestInput(RunningStage.TRAINING, [1]), batch_size=2, num_workers=None)
+    assert isinstance(datamodule.num_workers, int)
+    assert 0 <= datamodule.num_workers <= 8
+    assert datamodule.train_dataloader().num_workers == datamodule.num_workers
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_prefetch_factor():
+    datamodule = DataModule(TestInput(RunningStage.TRAINING, [1]), batch_size=2, num_workers=1, prefetch_factor=4)
+    assert datamodule.train_dataloader().prefetch_factor == 4
+
+    # `prefetch_factor` is not forwarded when loading in the main process
+    datamodule = DataModule(TestInput(RunningStage.TRAINING, [1]), batch_size=2, num_workers=0, prefetch_factor=4)
+    assert datamodule.train_dataloader().prefetch_factor != 4
+
+    # `prefetch_factor` is forwarded to the `process_*_dataset` hooks of an attached `Task`
+    datamodule = DataModule(TestInput(RunningStage.TRAINING, [1]), batch_size=2, num_workers=1, prefetch_factor=4)
+    trainer = Trainer(fast_dev_run=True)
+    trainer.strategy.connect(Task(torch.nn.Linear(1, 1)))
+    datamodule.trainer = trainer
+    assert datamodule.train_dataloader().prefetch_factor == 4
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_prefetch_factor_not_forwarded_by_default():
+    class LegacyTask(Task):
+        def process_train_dataset(
+            self,
+            dataset,
+            batch_size,
+            num_workers=0,
+            pin_memory=False,
+            shuffle=True,
+            drop_last=True,
+            sampler=None,
+            persistent_workers=False,
+            input_transform=None,
+            trainer=None,
+        ):
+            return super().process_train_dataset(
+                dataset,
+                batch_size,
+                num_workers=num_workers,
+                pin_memory=pin_memory,
+                shuffle=shuffle,
+                drop_last=drop_last,
+                sampler=sampler,
+                persistent_workers=persistent_workers,
+                input_transform=input_transform,
+                trainer=trainer,
+            )
+
+    # Overrides without a `prefetch_factor` argument keep working when it isn't set
+    datamodule = DataModule(TestInput(RunningStage.TRAINING, [1]), batch_size=2, num_workers=1)
+    trainer = Trainer(fast_dev_run=True)
+    trainer.strategy.connect(LegacyTask(torch.nn.Linear(1, 1)))
+    datamodule.trainer = trainer
+    assert datamodule.train_dataloader().num_workers == 1
+
+
+@pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+def test_show_batch_with_persistent_workers(monkeypatch):
+    monkeypatch.setenv("FLASH_TESTING", "0")
+    datamodule = DataModule(
+        TestInput(RunningStage.TRAINING, [1]),
+        batch_size=2,
+        num_workers=1,
+        persistent_workers=True,
+        data_fetcher=BaseVisualization(),
+    )
+
+    # the visualization iterator loads in the main process, where torch rejects persistent workers
+    datamodule.show_train_batch()
+    assert datamodule.num_workers == 1
+    assert datamodule.persistent_workers
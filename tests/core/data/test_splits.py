@@ -26,6 +26,7 @@ def test_split_dataset():
     assert len(train_ds) == 90
     assert len(val_ds) == 10
     assert len(np.unique(train_ds.indices)) == len(train_ds.indices)
+    assert train_ds.indices.dtype == np.int32
 
     class Dataset:
         def __init__(self):
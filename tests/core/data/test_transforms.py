@@ -67,3 +67,12 @@ class TestApplyToKeys:
     )
     def test_repr(self, transform, expected):
         assert repr(transform) == expected
+
+    @pytest.mark.skipif(not _TOPIC_CORE_AVAILABLE, reason="Not testing core.")
+    def test_forward_uses_children(self):
+        transform = ApplyToKeys("input", lambda x: x + 1)
+        assert transform({"input": 1}) == {"input": 2}
+
+        transform[0] = torch.nn.Identity()
+        transform.add_module("1", torch.nn.Identity())
+        assert transform({"input": 1}) == {"input": 1}
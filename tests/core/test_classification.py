@@ -34,6 +34,7 @@ def test_classification_outputs():
         torch.tensor(ProbabilitiesOutput().transform(example_output)), torch.softmax(example_output, -1)
     )
     assert ClassesOutput().transform(example_output) == 2
+    assert ClassesOutput().transform(torch.quantize_per_tensor(example_output, 0.01, 0, torch.qint8)) == 2
     assert LabelsOutput(labels).transform(example_output) == "class_3"
 
 